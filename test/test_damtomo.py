@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+# Allow direct execution
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+import io
+
+from test.helper import FakeYDL
+from yt_dlp.extractor import DamtomoRecordIE
+
+TEST_URL = 'https://www.clubdam.com/app/damtomo/karaokePost/StreamingKrk.do?karaokeContributeId=27489418'
+
+WEBPAGE = '''<html><head><meta charset="Shift_JIS"></head><body>
+<p class="song_title">心みだれて〜say it with flowers〜(生音)</p>
+<p class="song_artist">小林明子</p>
+<p class="user_name">%s</p>
+<a href="https://www.clubdam.com/app/damtomo/member/info/Profile.do?damtomoId=NjI1MjI2MjU">x</a>
+<p class="date">2021/08/15</p>
+<p class="audience">5</p>
+<p class="nice">3</p>
+</body></html>'''
+
+STREAM_XML = '''<?xml version="1.0" encoding="Shift_JIS"?>
+<document xmlns="https://www.clubdam.com/app/damtomo/karaokePost/GetStreamingKrkUrlXML">
+<streamingUrl>https://example.com/x.m3u8?a=1&amp;b=2&#38;c=3</streamingUrl></document>'''
+
+
+class FakeResponse(io.BytesIO):
+    def __init__(self, data, url):
+        super().__init__(data)
+        self.url = url
+        self.headers = {}
+
+    def geturl(self):
+        return self.url
+
+
+class DamtomoFakeYDL(FakeYDL):
+    def __init__(self, user_name):
+        super().__init__()
+        self._user_name = user_name
+
+    def urlopen(self, req):
+        url = req.get_full_url()
+        content = STREAM_XML if 'GetStreamingKrkUrlXML' in url else WEBPAGE % self._user_name
+        return FakeResponse(content.encode('sjis'), url)
+
+
+class TestDamtomo(unittest.TestCase):
+    def _extract(self, user_name):
+        ie = DamtomoRecordIE(DamtomoFakeYDL(user_name))
+        m3u8_urls = []
+        ie._extract_m3u8_formats = lambda m3u8_url, *args, **kwargs: m3u8_urls.append(m3u8_url) or []
+        return ie.extract(TEST_URL), m3u8_urls
+
+    def test_stream_url_is_unescaped(self):
+        info, m3u8_urls = self._extract('箱の「中の人」 さん')
+        self.assertEqual(m3u8_urls, ['https://example.com/x.m3u8?a=1&b=2&c=3'])
+        self.assertEqual(info['uploader'], '箱の「中の人」')
+        self.assertEqual(info['upload_date'], '20210815')
+        self.assertEqual(info['view_count'], 5)
+        self.assertEqual(info['like_count'], 3)
+
+    def test_empty_user_name(self):
+        info, _ = self._extract(' ')
+        self.assertIsNone(info['uploader'])
+        self.assertEqual(info['title'], '心みだれて〜say it with flowers〜(生音)')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,9 +4,16 @@
 from ..utils import (
     ExtractorError,
     clean_html,
-    int_or_none,
-    try_get,
-    unified_strdate)
+    unescapeHTML,
+)
+
+_DATA_RE = re.compile(r'<(p|div)\s+class="(?P<class>[^" ]+)">(?P<value>.+?)</\1>', re.S)
+_DESC_RE = re.compile(r'<div id="public_comment">\s*<p>\s*([^<]*?)\s*</p>')
+_UPLOADER_ID_RE = re.compile(r'<a href="https://www\.clubdam\.com/app/damtomo/member/info/Profile\.do\?damtomoId=([^"]+)"')
+_STREAM_URL_RE = re.compile(r'<(?:\w+:)?streamingUrl[^>]*>\s*([^<]+?)\s*</(?:\w+:)?streamingUrl>')
+_WS_RE = re.compile(r'\s+')
+_DATE_RE = re.compile(r'(\d{4}/\d{2}/\d{2})')
+_NUM_RE = re.compile(r'(\d+)')
 
 
 class DamtomoBaseIE(InfoExtractor):
@@ -19,28 +26,45 @@ def _real_extract(self, url):
         if '<h2>予期せぬエラーが発生しました。</h2>' in webpage:
             raise ExtractorError('There is an error on server-side. Try again later.', expected=True)
 
-        description = self._search_regex(r'(?m)<div id="public_comment">\s*<p>\s*([^<]*?)\s*</p>', webpage, 'description', default=None)
-        uploader_id = self._search_regex(r'<a href="https://www\.clubdam\.com/app/damtomo/member/info/Profile\.do\?damtomoId=([^"]+)"', webpage, 'uploader_id', default=None)
+        # everything we extract is in <body>; don't make every pattern scan <head> as well
+        body_start = webpage.find('<body')
+        if body_start != -1:
+            webpage = webpage[body_start:]
+
+        mobj = _DESC_RE.search(webpage)
+        description = mobj.group(1) if mobj else None
+        mobj = _UPLOADER_ID_RE.search(webpage)
+        uploader_id = mobj.group(1) if mobj else None
+
+        data_dict = {}
+        for mobj in _DATA_RE.finditer(webpage):
+            value = clean_html(mobj.group('value'))
+            if value:
+                data_dict[mobj.group('class')] = _WS_RE.sub(' ', value)
 
-        data_dict = {
-            mobj.group('class'): re.sub(r'\s+', ' ', clean_html(mobj.group('value')))
-            for mobj in re.finditer(r'(?s)<(p|div)\s+class="(?P<class>[^" ]+?)">(?P<value>.+?)</\1>', webpage)}
+        user_name = data_dict.get('user_name')
+        if user_name:
+            user_name = user_name.rstrip()
+            if user_name.endswith('さん'):
+                user_name = user_name[:-2].rstrip()
 
         # since videos do not have title, give the name of song instead
-        data_dict['user_name'] = re.sub(r'\s*さん\s*$', '', data_dict['user_name'])
         title = data_dict.get('song_title')
 
-        stream_tree = self._download_xml(
-            self._DKML_XML_URL % video_id, video_id, note='Requesting stream information', encoding='sjis',
-            # doing this has no problem since there is no character outside ASCII,
-            # and never likely to happen in the future
-            transform_source=lambda x: re.sub(r'\s*encoding="[^"]+?"', '', x))
-
-        m3u8_url = try_get(stream_tree, lambda x: x.find(
-            './/d:streamingUrl', {'d': self._DKML_XML_NS}).text.strip(), str)
-        if not m3u8_url:
+        # the response holds a single <streamingUrl>; no need to parse the whole XML for it
+        stream_xml = self._download_webpage(
+            self._DKML_XML_URL % video_id, video_id, note='Requesting stream information', encoding='sjis')
+        mobj = _STREAM_URL_RE.search(stream_xml)
+        if not mobj:
             raise ExtractorError('Failed to obtain m3u8 URL')
-        formats = self._extract_m3u8_formats(m3u8_url, video_id, ext='mp4')
+        formats = self._extract_m3u8_formats(unescapeHTML(mobj.group(1)), video_id, ext='mp4')
+
+        mobj = _DATE_RE.search(data_dict.get('date', ''))
+        upload_date = mobj.group(1).replace('/', '') if mobj else None
+        mobj = _NUM_RE.search(data_dict.get('audience', ''))
+        view_count = int(mobj.group(1)) if mobj else None
+        mobj = _NUM_RE.search(data_dict.get('nice', ''))
+        like_count = int(mobj.group(1)) if mobj else None
 
         return {
             'id': video_id,
@@ -48,10 +72,10 @@ def _real_extract(self, url):
             'uploader_id': uploader_id,
             'description': description,
             'formats': formats,
-            'uploader': data_dict.get('user_name'),
-            'upload_date': unified_strdate(self._search_regex(r'(\d{4}/\d{2}/\d{2})', data_dict.get('date'), 'upload_date', default=None)),
-            'view_count': int_or_none(self._search_regex(r'(\d+)', data_dict['audience'], 'view_count', default=None)),
-            'like_count': int_or_none(self._search_regex(r'(\d+)', data_dict['nice'], 'like_count', default=None)),
+            'uploader': user_name,
+            'upload_date': upload_date,
+            'view_count': view_count,
+            'like_count': like_count,
             'track': title,
             'artist': data_dict.get('song_artist'),
         }
@@ -62,7 +86,6 @@ class DamtomoVideoIE(DamtomoBaseIE):
     _VALID_URL = r'https?://(?:www\.)?clubdam\.com/app/damtomo/(?:SP/)?karaokeMovie/StreamingDkm\.do\?karaokeMovieId=(?P<id>\d+)'
     _WEBPAGE_URL_TMPL = 'https://www.clubdam.com/app/damtomo/karaokeMovie/StreamingDkm.do?karaokeMovieId=%s'
     _DKML_XML_URL = 'https://www.clubdam.com/app/damtomo/karaokeMovie/GetStreamingDkmUrlXML.do?movieSelectFlg=2&karaokeMovieId=%s'
-    _DKML_XML_NS = 'https://www.clubdam.com/app/damtomo/karaokeMovie/GetStreamingDkmUrlXML'
     _TESTS = [{
         'url': 'https://www.clubdam.com/app/damtomo/karaokeMovie/StreamingDkm.do?karaokeMovieId=2414316',
         'info_dict': {
@@ -82,7 +105,6 @@ class DamtomoRecordIE(DamtomoBaseIE):
     _VALID_URL = r'https?://(?:www\.)?clubdam\.com/app/damtomo/(?:SP/)?karaokePost/StreamingKrk\.do\?karaokeContributeId=(?P<id>\d+)'
     _WEBPAGE_URL_TMPL = 'https://www.clubdam.com/app/damtomo/karaokePost/StreamingKrk.do?karaokeContributeId=%s'
     _DKML_XML_URL = 'https://www.clubdam.com/app/damtomo/karaokePost/GetStreamingKrkUrlXML.do?karaokeContributeId=%s'
-    _DKML_XML_NS = 'https://www.clubdam.com/app/damtomo/karaokePost/GetStreamingKrkUrlXML'
     _TESTS = [{
         'url': 'https://www.clubdam.com/app/damtomo/karaokePost/StreamingKrk.do?karaokeContributeId=27376862',
         'info_dict': {